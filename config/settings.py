@@ -23,3 +23,4 @@ SERVICE_ATTACHMENT_SECRET_TOKEN = os.getenv("SERVICE_ATTACHMENT_SECRET_TOKEN")
 # Notification
 SERVICE_NOTIFICATION_HOST = os.getenv("SERVICE_NOTIFICATION_HOST")
 SERVICE_NOTIFICATION_SECRET_KEY = os.getenv("SERVICE_NOTIFICATION_SECRET_KEY")
+SERVICE_NOTIFICATION_CHUNK_SIZE = max(1, int(os.getenv("SERVICE_NOTIFICATION_CHUNK_SIZE") or 500))
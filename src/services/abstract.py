@@ -1,4 +1,9 @@
 import requests
+import threading
+
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from django.utils.translation import ugettext_lazy as _
 
@@ -10,6 +15,10 @@ from contextlib import suppress
 
 from simplejson import JSONDecodeError
 
+# Connection pools of the session shared by every service
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
 
 class AbstractServiceProvider(ABC):
     default_headers = {
@@ -19,6 +28,13 @@ class AbstractServiceProvider(ABC):
         'accept': '*/*'
     }
 
+    # Shared across instances, keeps connections alive between requests
+    _session = None
+    _session_lock = threading.Lock()
+
+    # Seconds, (connect, read)
+    timeout = (5, 30)
+
     def __init__(self):
         self.host = None
         self.key = None
@@ -28,7 +44,7 @@ class AbstractServiceProvider(ABC):
         self.agent = None
         self.soap = None
         self.secret = None
-        self.headers = self.default_headers
+        self.headers = dict(self.default_headers)
 
         # Auth service
         self.auth()
@@ -42,6 +58,36 @@ class AbstractServiceProvider(ABC):
         """
         ...
 
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Get process wide session with pooled keep-alive connections
+        :return: requests.Session instance.
+        """
+        if AbstractServiceProvider._session is not None:
+            return AbstractServiceProvider._session
+
+        with AbstractServiceProvider._session_lock:
+            # Created by another thread while waiting for the lock
+            if AbstractServiceProvider._session is not None:
+                return AbstractServiceProvider._session
+
+            session = requests.Session()
+            # Services are called on behalf of different users, never persist cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(connect=3, read=0, backoff_factor=0.3)
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+            AbstractServiceProvider._session = session
+
+        return AbstractServiceProvider._session
+
     def create_request(self, method: str, **kwargs):
         """
         Make a request but return response instance
@@ -52,9 +98,10 @@ class AbstractServiceProvider(ABC):
         url = kwargs.pop('url')
         params = {'url': f'{self.host}{url}', 'headers': self.headers, 'allow_redirects': True}
         params.update(kwargs)
+        params.setdefault('timeout', self.timeout)
 
-        # Where requests is a package, method are 'get' or 'post'
-        response = getattr(requests, method)(**params)
+        # Where session is a requests.Session, method are 'get' or 'post'
+        response = getattr(self.get_session(), method)(**params)
 
         if response.status_code not in [HTTP_200_OK, HTTP_202_ACCEPTED, HTTP_201_CREATED]:
             detail = {}
@@ -16,6 +16,9 @@ from config.settings import (SERVICE_ATTACHMENT_HOST, SERVICE_ATTACHMENT_SECRET_
 class AttachmentService(AbstractServiceProvider):
     URL_POST_FILE = 'file/upload/'
 
+    # Large uploads are processed server side before responding, no read timeout
+    timeout = (5, None)
+
     def __init__(self):
         super().__init__()
 
@@ -129,6 +132,7 @@ class AttachmentService(AbstractServiceProvider):
     @staticmethod
     def _save(**kwargs):
         response = kwargs.get('response', {})
+        timestamp = response.get('created_at') or datetime.now()
         # Object saving
         attributes = response.get('attributes', {})
         output = {
@@ -136,8 +140,8 @@ class AttachmentService(AbstractServiceProvider):
             'file_name': response.get('file_hash', ''),
             'name': response.get('name', ''),
             'size': response.get('size', 0),
-            'timestamp': response.get('created_at', datetime.now()),
-            'edited_timestamp': response.get('created_at', datetime.now()),
+            'timestamp': timestamp,
+            'edited_timestamp': timestamp,
             'width': attributes.get('width', 0),
             'height': attributes.get('height', 0),
             'mime_type': response.get('content_type', ''),
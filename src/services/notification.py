@@ -1,11 +1,16 @@
-import json
+import orjson
 
+from concurrent.futures import ThreadPoolExecutor
+from requests import RequestException
+from django.utils.functional import Promise
 from rest_framework.exceptions import ValidationError
 from datetime import datetime
 from contextlib import suppress
 from src.helpers.notification import NotificationHelper
-from src.services.abstract import AbstractServiceProvider
-from config.settings import (SERVICE_NOTIFICATION_HOST, SERVICE_NOTIFICATION_SECRET_KEY)
+from src.services.abstract import AbstractServiceProvider, POOL_MAXSIZE
+from simplejson import JSONDecodeError
+from config.settings import (SERVICE_NOTIFICATION_HOST, SERVICE_NOTIFICATION_SECRET_KEY,
+                             SERVICE_NOTIFICATION_CHUNK_SIZE)
 
 
 # Create your services here.
@@ -20,31 +25,26 @@ class NotificationService(AbstractServiceProvider):
 
         self.host = SERVICE_NOTIFICATION_HOST
         self.key = SERVICE_NOTIFICATION_SECRET_KEY
-        self.headers = self.default_headers
 
         # Authorize
         self.auth()
 
     @staticmethod
     def _set_method_payload(**kwargs):
-        method = kwargs.get('method', 'email')
-        recipient = kwargs.get('recipient', '')
-        sender = kwargs.get('sender', '')
-        subject = str(kwargs.get('subject', ''))
+        subject = kwargs.get('subject', '')
         body = kwargs.get('body', '')
-        internal = kwargs.get('internal', False)
 
         # Compose payload
         payload = {
-            "is_internal_recipient": internal,
-            "recipient": recipient,
-            "delivery_method": method,
-            "message_subject": subject,
-            "message_body": str(body)
+            "is_internal_recipient": kwargs.get('internal', False),
+            "recipient": kwargs.get('recipient', ''),
+            "delivery_method": kwargs.get('method', 'email'),
+            "message_subject": subject if isinstance(subject, str) else str(subject),
+            "message_body": body if isinstance(body, str) else str(body)
         }
 
-        if sender != '':
-            payload.update({'sender': sender})
+        if (sender := kwargs.get('sender', '')) != '':
+            payload['sender'] = sender
 
         return payload
 
@@ -56,67 +56,176 @@ class NotificationService(AbstractServiceProvider):
         """
         # forming payload
         dump = kwargs.get('dump', False)
+        delay = kwargs.get('delay', False)
         payload = self._set_method_payload(**kwargs)
 
         # forming metadata for db
         if metadata := kwargs.get('metadata', {}):
-            metadata['title'] = str(metadata.get('title'))
-            metadata['description'] = str(metadata.get('description'))
+            metadata = {
+                **metadata,
+                'title': str(metadata.get('title')),
+                'description': str(metadata.get('description'))
+            }
 
         if dump or not payload.get('recipient'):
             return payload
 
-        data = json.dumps(payload)
+        # Dispatch to worker, return immediately
+        if delay:
+            from src.tasks import deliver_notification
+            # Same encoding as the synchronous path, raises TypeError for non JSON values
+            deliver_notification.delay(orjson.loads(self.dumps(payload)), orjson.loads(self.dumps(metadata)))
+            return payload
+
+        return self.deliver(payload, metadata)
+
+    def deliver(self, payload: dict, metadata: dict = None):
+        """
+        Post single notification payload and save response
+        :param payload:
+        :param metadata:
+        :return:
+        """
+        data = self.dumps(payload)
         params = {'url': self.URL_POST_WAITING, 'data': data}
         with suppress(ValidationError):
             response = self.make_request(method='post', **params)
-            return self._save(response=response, metadata=metadata)
+            return self._save(response=response, metadata=metadata or {})
 
         return
 
-    def bulk_send(self, notifications: list = None):
+    def bulk_send(self, notifications: list = None, delay: bool = False):
         """
         Send multiple notification message
         :param notifications:
+        :param delay:
         :return:
         """
         if not notifications:
             return []
 
-        data = json.dumps({'notifications': notifications})
+        # Dispatch chunks to workers in parallel, return immediately
+        if delay:
+            from celery import group
+            from src.tasks import deliver_notifications_bulk
+            # Same encoding as the synchronous path, lazy strings included
+            chunks = (orjson.loads(self.dumps(chunk)) for chunk in self.chunked(notifications))
+            group(deliver_notifications_bulk.s(chunk) for chunk in chunks).apply_async()
+            return notifications
+
+        return self.deliver_bulk(notifications)
+
+    def deliver_bulk(self, notifications: list):
+        """
+        Post multiple notification payloads in chunks and save responses,
+        None when any chunk was rejected, see deliver_chunks for per chunk outcome
+        :param notifications:
+        :return:
+        """
+        results = self.deliver_chunks(self.chunked(notifications))
+
+        # Raise transport and decode errors once every chunk is done, as a single bulk post did
+        for result in results:
+            if result['error'] is not None and not isinstance(result['error'], ValidationError):
+                raise result['error']
+
+        if any(result['elements'] is None for result in results):
+            return
+
+        return [element for result in results for element in result['elements']]
+
+    def deliver_chunks(self, chunks: list):
+        """
+        Post chunks of notification payloads concurrently and save responses
+        :param chunks: Lists of notification payloads.
+        :return: list of dicts with chunk notifications, saved elements and error, in chunk order.
+        """
+        results = [{'notifications': chunk, 'elements': None, 'error': None} for chunk in chunks]
+
+        if len(results) == 1:
+            self._deliver_result(results[0])
+            return results
+
+        # Chunks share the pooled session, keep workers within pool size
+        if results:
+            with ThreadPoolExecutor(max_workers=min(len(results), POOL_MAXSIZE)) as executor:
+                list(executor.map(self._deliver_result, results))
+
+        return results
+
+    def _deliver_result(self, result: dict):
+        """
+        Post chunk of result and record saved elements or error on it
+        :param result:
+        :return:
+        """
+        try:
+            result['elements'] = self._deliver_chunk(result['notifications'])
+        except (ValidationError, RequestException, JSONDecodeError) as error:
+            result['error'] = error
+
+        return result
+
+    def _deliver_chunk(self, notifications: list):
+        """
+        Post single chunk of notification payloads and save responses
+        :param notifications:
+        :return:
+        """
+        data = self.dumps({'notifications': notifications})
         params = {'url': self.URL_POST_WAITING_BULK, 'data': data}
 
-        with suppress(ValidationError):
-            response = self.make_request(method='post', **params)
+        response = self.make_request(method='post', **params)
 
-            # Saving
-            elements = []
-            notifications = response.get('notifications', [])
-            for notification in notifications:
-                elements.append(self._save(response=notification))
+        # Saving
+        return [self._save(response=notification) for notification in response.get('notifications', [])]
 
-            return elements
+    @staticmethod
+    def dumps(value) -> bytes:
+        """
+        Encode value to JSON bytes, lazy translation strings included
+        :param value:
+        :return: bytes
+        """
+        return orjson.dumps(value, default=NotificationService._default, option=orjson.OPT_NON_STR_KEYS)
 
-        return
+    @staticmethod
+    def _default(value):
+        # Anything else than lazy strings must fail as with json.dumps
+        if isinstance(value, Promise):
+            return str(value)
+
+        raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+    @staticmethod
+    def chunked(elements: list, size: int = SERVICE_NOTIFICATION_CHUNK_SIZE):
+        """
+        Split elements in chunks of size
+        :param elements:
+        :param size:
+        :return:
+        """
+        return [elements[index:index + size] for index in range(0, len(elements), size)]
 
     @staticmethod
     def _save(**kwargs):
         response = kwargs.get('response', {})
         delivery_method = response.get('delivery_method', 'email').upper()
         metadata = kwargs.get('metadata', {})
+        timestamp = response.get('created_at') or datetime.now()
 
         # Object saving
         output = {
             'title': response.get('message_subject', ''),
             'description': response.get('message_body', ''),
             'read': response.get('is_read', False),
-            'timestamp': response.get('created_at', datetime.now()),
+            'timestamp': timestamp,
             'delivery_method': delivery_method,
-            'edited_timestamp': response.get('modified_at', datetime.now()),
+            'edited_timestamp': response.get('modified_at') or timestamp,
             'recipient': response.get('recipient', ''),
             'sender': response.get('sender', ''),
             'code_name': response.get('id', ''),
-            'type': response.get('delivery_method', 'email').upper(),
+            'type': delivery_method,
             'data': response,
             'status': NotificationHelper.STATUS_NOTIFIED,
             'metadata': metadata
@@ -1,5 +1,3 @@
-import json
-
 from abc import ABC
 
 from src.services.abstract import AbstractServiceProvider
@@ -37,8 +35,7 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
-        params = {'url': self.URL_POST_LOGIN, 'data': data}
+        params = {'url': self.URL_POST_LOGIN, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -51,9 +48,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_POST_LOGIN, 'data': data}
+        params = {'url': self.URL_POST_LOGIN, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -68,9 +64,8 @@ class SSOService(AbstractServiceProvider, ABC):
         headers = kwargs.get('headers', {})
         authorization = headers.get('Authorization', '')
 
-        data = json.dumps(payload)
         self.headers.update({'Authorization': authorization})
-        params = {'url': self.URL_PATCH_PASSWORD, 'data': data}
+        params = {'url': self.URL_PATCH_PASSWORD, 'json': payload}
         response = self.make_request(method='patch', **params)
 
         return response
@@ -83,9 +78,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_POST_RESTORE_PASSWORD, 'data': data}
+        params = {'url': self.URL_POST_RESTORE_PASSWORD, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -98,9 +92,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_POST_RESTORE_CONFIRM_PASSWORD, 'data': data}
+        params = {'url': self.URL_POST_RESTORE_CONFIRM_PASSWORD, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -113,9 +106,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_POST_REFRESH, 'data': data}
+        params = {'url': self.URL_POST_REFRESH, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -128,9 +120,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_POST_REGISTER, 'data': data}
+        params = {'url': self.URL_POST_REGISTER, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -143,9 +134,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_POST_CONFIRM, 'data': data}
+        params = {'url': self.URL_POST_CONFIRM, 'json': payload}
         response = self.make_request(method='post', **params)
 
         return response
@@ -158,9 +148,8 @@ class SSOService(AbstractServiceProvider, ABC):
         """
         payload = kwargs.get('data', {})
 
-        data = json.dumps(payload)
         self.headers.pop('Authorization', None)
-        params = {'url': self.URL_PATCH_RESEND, 'data': data}
+        params = {'url': self.URL_PATCH_RESEND, 'json': payload}
         response = self.make_request(method='patch', **params)
 
         return response
@@ -0,0 +1,54 @@
+from celery import shared_task
+from requests import ConnectionError, ConnectTimeout
+from urllib3.exceptions import NewConnectionError
+
+from src.services.notification import NotificationService
+
+
+# Create your tasks here.
+
+def is_connect_failure(error: ConnectionError) -> bool:
+    """
+    Whether the request failed before reaching the service, only then it is safe to post again
+    :param error: requests.ConnectionError instance.
+    :return: bool
+    """
+    if isinstance(error, ConnectTimeout):
+        return True
+
+    # Connection refused or unresolved host, wrapped in urllib3 MaxRetryError
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3)
+def deliver_notification(self, payload: dict, metadata: dict = None):
+    """
+    Deliver single notification payload in background
+    :param self: Task instance.
+    :param payload: Composed notification payload.
+    :param metadata:
+    :return:
+    """
+    try:
+        return NotificationService().deliver(payload, metadata)
+    except ConnectionError as error:
+        if not is_connect_failure(error):
+            raise
+        raise self.retry(exc=error, countdown=2 ** self.request.retries)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3)
+def deliver_notifications_bulk(self, notifications: list):
+    """
+    Deliver multiple notification payloads in background
+    :param self: Task instance.
+    :param notifications: Composed notification payloads.
+    :return:
+    """
+    try:
+        return NotificationService().deliver_bulk(notifications)
+    except ConnectionError as error:
+        if not is_connect_failure(error):
+            raise
+        raise self.retry(exc=error, countdown=2 ** self.request.retries)
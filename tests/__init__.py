@@ -0,0 +1,8 @@
+import django
+
+from django.conf import settings
+
+# Services import rest_framework, which needs configured settings
+if not settings.configured:
+    settings.configure()
+    django.setup()
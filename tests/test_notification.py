@@ -0,0 +1,130 @@
+import orjson
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from celery import Celery
+from django.utils.translation import gettext_lazy as _
+from requests import ConnectionError
+from rest_framework.exceptions import ValidationError
+
+from src.services.notification import NotificationService
+
+
+def respond(method, **kwargs):
+    """
+    Fake notification service, echoes posted notifications, rejects recipient 'rejected'
+    """
+    data = orjson.loads(kwargs['data'])
+    if 'notifications' not in data:
+        return {'id': data['recipient'], **data}
+
+    recipients = [notification['recipient'] for notification in data['notifications']]
+    if 'rejected' in recipients:
+        raise ValidationError({'detail': 'rejected'})
+    if 'down' in recipients:
+        raise ConnectionError('down')
+
+    return {'notifications': [{'id': recipient, 'recipient': recipient} for recipient in recipients]}
+
+
+def chunked(elements: list, size: int = 2):
+    return [elements[index:index + size] for index in range(0, len(elements), size)]
+
+
+def notifications(*recipients):
+    return [{'recipient': recipient, 'delivery_method': 'email'} for recipient in recipients]
+
+
+class ChunkedTestCase(TestCase):
+    def test_empty(self):
+        self.assertEqual(NotificationService.chunked([], 2), [])
+
+    def test_exact_multiple(self):
+        self.assertEqual(NotificationService.chunked([1, 2, 3, 4], 2), [[1, 2], [3, 4]])
+
+    def test_remainder(self):
+        self.assertEqual(NotificationService.chunked([1, 2, 3], 2), [[1, 2], [3]])
+
+    def test_size_larger_than_list(self):
+        self.assertEqual(NotificationService.chunked([1, 2, 3], 500), [[1, 2, 3]])
+
+    def test_size_one(self):
+        self.assertEqual(NotificationService.chunked([1, 2], 1), [[1], [2]])
+
+
+@patch.object(NotificationService, 'make_request', side_effect=respond)
+class DeliverChunksTestCase(TestCase):
+    def setUp(self):
+        self.service = NotificationService()
+
+    def test_partial_failure_keeps_delivered_rows(self, make_request):
+        chunks = chunked(notifications('a', 'b', 'rejected', 'c', 'down'))
+        results = self.service.deliver_chunks(chunks)
+
+        self.assertEqual([result['notifications'] for result in results], chunks)
+        self.assertEqual([element['code_name'] for element in results[0]['elements']], ['a', 'b'])
+        self.assertIsNone(results[1]['elements'])
+        self.assertIsInstance(results[1]['error'], ValidationError)
+        self.assertIsNone(results[2]['elements'])
+        self.assertIsInstance(results[2]['error'], ConnectionError)
+        self.assertEqual(make_request.call_count, 3)
+
+    def test_empty(self, make_request):
+        self.assertEqual(self.service.deliver_chunks([]), [])
+        make_request.assert_not_called()
+
+    @patch.object(NotificationService, 'chunked', staticmethod(chunked))
+    def test_deliver_bulk_success(self, make_request):
+        elements = self.service.deliver_bulk(notifications('a', 'b', 'c'))
+        self.assertEqual([element['code_name'] for element in elements], ['a', 'b', 'c'])
+
+    @patch.object(NotificationService, 'chunked', staticmethod(chunked))
+    def test_deliver_bulk_rejected_chunk(self, make_request):
+        self.assertIsNone(self.service.deliver_bulk(notifications('a', 'b', 'rejected')))
+
+    def test_deliver_bulk_raises_for_single_chunk(self, make_request):
+        with self.assertRaises(ConnectionError):
+            self.service.deliver_bulk(notifications('a', 'down'))
+
+    @patch.object(NotificationService, 'chunked', staticmethod(chunked))
+    def test_deliver_bulk_raises_for_many_chunks(self, make_request):
+        with self.assertRaises(ConnectionError):
+            self.service.deliver_bulk(notifications('a', 'b', 'down'))
+        self.assertEqual(make_request.call_count, 2)
+
+
+@patch.object(NotificationService, 'make_request', side_effect=respond)
+class DelayTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.app = Celery('tests', set_as_current=True)
+        cls.app.conf.task_always_eager = True
+        cls.app.conf.task_eager_propagates = True
+
+    def setUp(self):
+        self.service = NotificationService()
+
+    def test_send_returns_payload(self, make_request):
+        payload = self.service.send(recipient='a', subject=_('Subject'), body='Body', delay=True)
+
+        self.assertEqual(payload['recipient'], 'a')
+        self.assertEqual(payload['message_subject'], 'Subject')
+        make_request.assert_called_once()
+
+    def test_send_rejects_non_json_metadata(self, make_request):
+        with self.assertRaises(TypeError):
+            self.service.send(recipient='a', metadata={'ids': {1, 2}}, delay=True)
+        make_request.assert_not_called()
+
+    @patch.object(NotificationService, 'chunked', staticmethod(chunked))
+    def test_bulk_send_dispatches_chunks(self, make_request):
+        elements = notifications('a', 'b', 'c', _('d'), 'e')
+
+        self.assertIs(self.service.bulk_send(elements, delay=True), elements)
+        self.assertEqual(make_request.call_count, 3)
+
+        posted = [orjson.loads(call.kwargs['data']) for call in make_request.call_args_list]
+        recipients = sorted(notification['recipient'] for data in posted for notification in data['notifications'])
+        self.assertEqual(recipients, ['a', 'b', 'c', 'd', 'e'])
@@ -0,0 +1,48 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from celery import Celery
+from celery.exceptions import Retry
+from requests import ConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from src.services.notification import NotificationService
+from src.tasks import deliver_notification, is_connect_failure
+
+
+def refused():
+    reason = NewConnectionError(None, 'Connection refused')
+    return ConnectionError(MaxRetryError(None, 'http://notification/', reason=reason))
+
+
+class IsConnectFailureTestCase(TestCase):
+    def test_refused(self):
+        self.assertTrue(is_connect_failure(refused()))
+
+    def test_connect_timeout(self):
+        self.assertTrue(is_connect_failure(ConnectTimeout()))
+
+    def test_aborted_after_send(self):
+        self.assertFalse(is_connect_failure(ConnectionError(ProtocolError('Connection aborted.'))))
+
+
+class DeliverNotificationTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.app = Celery('tests', set_as_current=True)
+        cls.app.conf.task_always_eager = True
+        cls.app.conf.task_eager_propagates = True
+
+    @patch.object(NotificationService, 'make_request', side_effect=ReadTimeout())
+    def test_read_timeout_not_retried(self, make_request):
+        with self.assertRaises(ReadTimeout):
+            deliver_notification.delay({'recipient': 'a'}, {})
+        make_request.assert_called_once()
+
+    @patch.object(NotificationService, 'make_request', side_effect=refused())
+    def test_refused_retried(self, make_request):
+        # Eager tasks report the scheduled retry instead of running it
+        with self.assertRaises(Retry):
+            deliver_notification.delay({'recipient': 'a'}, {})
+        make_request.assert_called_once()